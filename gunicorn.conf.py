@@ -0,0 +1,12 @@
+# gunicorn -c gunicorn.conf.py
+
+wsgi_app = "wsgi:app"
+bind = "0.0.0.0:8081"
+
+# collectors keep every series in process memory, so one worker owns the
+# state and serves all dashboard requests from its thread pool; the app is
+# imported (and bootstrapped) inside that worker, so don't preload it
+workers = 1
+worker_class = "gthread"
+threads = 8
+preload_app = False
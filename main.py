@@ -1,17 +1,73 @@
 import requests
+import numpy as np
+import zstandard
 import time
 import threading
-import json
 import os
-from datetime import datetime, timezone, timedelta
-from collections import deque
-from flask import Flask, jsonify, render_template_string, request
+import sys
+import queue
+import signal
+import atexit
+import hashlib
+import glob
+import struct
+import mmap
+from operator import itemgetter
+from datetime import datetime
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+# only an alias of the builtin TimeoutError from Python 3.11 on
+from concurrent.futures import TimeoutError as FetchTimeout
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, request
+
+try:
+    from numba import njit
+except ImportError:
+    # without numba the signal kernels run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+try:
+    import orjson
+except ImportError:
+    # stdlib stand-in for the orjson calls made here; like orjson, NaN and
+    # inf go out as null wherever they sit, never as bare NaN tokens
+    import json
+    import math
+    from types import SimpleNamespace
+
+    def _json_safe(obj):
+        if isinstance(obj, dict):
+            return {k: _json_safe(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [_json_safe(v) for v in obj]
+        if isinstance(obj, np.ndarray):
+            return [_json_safe(v) for v in obj.tolist()]
+        if isinstance(obj, np.generic):
+            obj = obj.item()
+        if isinstance(obj, float):
+            return float(obj) if math.isfinite(obj) else None
+        return obj
+
+    orjson = SimpleNamespace(
+        OPT_NON_STR_KEYS=0,
+        OPT_SERIALIZE_NUMPY=0,
+        loads=json.loads,
+        dumps=lambda obj, option=0: json.dumps(
+            _json_safe(obj), allow_nan=False, separators=(",", ":")).encode(),
+    )
 
 # ================= Config =================
 
 REFRESH_INTERVAL = 10
 MAX_HOURS = 24 * 7
 MAX_POINTS = int(3600 / REFRESH_INTERVAL * MAX_HOURS)
+WINDOW_LONG = int(1800 / REFRESH_INTERVAL)
+WINDOW_SHORT = int(600 / REFRESH_INTERVAL)
 
 SIGNAL_CONFIG = {
     "funding_strong": -0.02,
@@ -22,98 +78,465 @@ SIGNAL_CONFIG = {
 }
 
 SYMBOLS = ["BTCUSDT", "ETHUSDT", "RIVERUSDT", "HYPEUSDT"]
+EXCHANGES = ["binance", "bybit", "okx", "bitget"]
+FIELDS = ("price", "funding", "oi")
+
+# the collector stops waiting on a tick's fetches after FETCH_BUDGET; the
+# requests timeout only bounds each connect and socket read, not a whole GET,
+# so (HTTP_RETRIES + 1) * HTTP_TIMEOUT under the budget is best effort and a
+# slow trickling response is cut off by the budget and skipped next tick
+FETCH_BUDGET = REFRESH_INTERVAL
+HTTP_TIMEOUT = 4
+HTTP_RETRIES = 1
+
+# seconds an exchange response is reused, matched against the request URL;
+# only a TTL longer than a tick can ever hit, so this is limited to OKX's
+# funding-rate endpoint, whose value moves far slower than a tick
+CACHE_TTL = {
+    "funding-rate": 3 * REFRESH_INTERVAL,
+}
 
 DATA_DIR = "data"
+WRITE_FLUSH_SEC = 0.5
+WRITE_BATCH_SIZE = 50
+# records waiting for the writer; past this, new ones are dropped rather than
+# queueing without bound while the disk is failing
+WRITE_QUEUE_MAX = 10000
+WRITE_FSYNC_SEC = 30
 os.makedirs(DATA_DIR, exist_ok=True)
 
 # ================= App =================
 
 app = Flask(__name__)
 symbols_state = {}
+LOG_FDS = {}
+LOG_DAYS = {}
+WRITE_Q = queue.Queue(maxsize=WRITE_QUEUE_MAX)
+# serialized /api/state payloads keyed by (symbol, points), least recently used first
+RESPONSE_CACHE = OrderedDict()
+RESPONSE_CACHE_SIZE = 32
+cache_lock = threading.Lock()
+rebuilding = set()
+# keys served since the last tick; only these are rebuilt ahead of the next poll
+requested = set()
+
+# ================= Series =================
+
+class Ring:
+    # fixed-size float ring; every value is written twice (at i and i+size)
+    # so the newest n values are always one contiguous view of buf. With a
+    # width each slot is a column of that many values, stored one row per
+    # series so every series' tail is still contiguous
+    def __init__(self, size, width=None, dtype=np.float64):
+        self.size = size
+        shape = (2 * size,) if width is None else (width, 2 * size)
+        self.buf = np.zeros(shape, dtype=dtype)
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("ring index out of range")
+        v = self.buf[..., self.head + self.size - self.count + i]
+        return float(v) if v.ndim == 0 else v.copy()
+
+    def append(self, x):
+        self.buf[..., self.head] = x
+        self.buf[..., self.head + self.size] = x
+        self.head = (self.head + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self.buf.dtype)[..., -self.size:]
+        n = values.shape[-1]
+        pos = (self.head + np.arange(n)) % self.size
+        self.buf[..., pos] = values
+        self.buf[..., pos + self.size] = values
+        self.head = (self.head + n) % self.size
+        self.count = min(self.count + n, self.size)
+
+    def tail(self, n):
+        n = min(n, self.count)
+        end = self.head + self.size
+        return self.buf[..., end - n:end]
+
+# columns of a symbol's series: the cross-exchange averages, then each
+# exchange's (price, funding, oi) in the same order as a log record
+COLUMNS = [f"{f}_avg" for f in FIELDS] + [f"{f}_{ex}" for ex in EXCHANGES for f in FIELDS]
+COL = {name: i for i, name in enumerate(COLUMNS)}
+PRICE_AVG, FUNDING_AVG, OI_AVG = COL["price_avg"], COL["funding_avg"], COL["oi_avg"]
+# series are stored as float32 (plenty for prices, funding and OI, half the
+# memory); signal math widens back to float64, and ts stays float64
+SERIES_DTYPE = np.float32
+# per-exchange lookups resolved once instead of formatting names per tick
+EX_COLS = {f: {ex: COL[f"{f}_{ex}"] for ex in EXCHANGES} for f in FIELDS}
+EX_BLOCK = {ex: slice(COL[f"price_{ex}"], COL[f"price_{ex}"] + len(FIELDS)) for ex in EXCHANGES}
 
 # ================= Persistence =================
 
+# one fixed-width record per snapshot: ts, then (price, funding, oi) for each
+# exchange in EXCHANGES order, NaN where an exchange didn't answer
+REC_WIDTH = 1 + len(EXCHANGES) * len(FIELDS)
+REC = struct.Struct(f"<{REC_WIDTH}d")
+SEGMENT_EXTS = ("bin", "bin.zst", "jsonl", "jsonl.zst")
+
 def log_file(symbol):
-    return os.path.join(DATA_DIR, f"{symbol}.jsonl")
+    return os.path.join(DATA_DIR, f"{symbol}.bin")
 
-def slice_deque(dq, n):
-    return list(dq)[-n:] if dq else []
+def legacy_log_file(symbol):
+    return os.path.join(DATA_DIR, f"{symbol}.jsonl")
 
-def mean(xs):
-    return sum(xs) / len(xs) if xs else 0
+def utc_day(ts=None):
+    return time.strftime("%Y-%m-%d", time.gmtime(ts))
+
+def segment_cutoff():
+    # oldest day that can still reach the MAX_HOURS window
+    return utc_day(time.time() - MAX_HOURS * 3600 - 86400)
+
+def segment_day(symbol, path):
+    day, _, ext = os.path.basename(path)[len(symbol) + 1:].partition(".")
+    return (day, ext) if ext in SEGMENT_EXTS else (None, None)
+
+def log_segments(symbol):
+    # rotated days live next to the open log as {symbol}-YYYY-MM-DD.{bin,jsonl}[.zst];
+    # a day written partly before the switch to .bin reads its .jsonl part first
+    cutoff = segment_cutoff()
+    paths = set(glob.glob(os.path.join(DATA_DIR, f"{symbol}-*")))
+    segments = []
+    for path in paths:
+        day, ext = segment_day(symbol, path)
+        if day is None or day < cutoff:
+            continue
+        if path + ".zst" in paths:
+            continue
+        segments.append(((day, ext.startswith("bin")), path))
+    return [path for _, path in sorted(segments)] + [log_file(symbol)]
+
+def prune_segments(symbol):
+    # days past the window are never loaded again
+    cutoff = segment_cutoff()
+    for path in glob.glob(os.path.join(DATA_DIR, f"{symbol}-*")):
+        day, _ = segment_day(symbol, path)
+        if day is not None and day < cutoff:
+            os.remove(path)
+
+def read_segment(path):
+    with open(path, "rb") as f:
+        if path.endswith(".zst"):
+            with zstandard.ZstdDecompressor().stream_reader(f) as r:
+                return r.read()
+        if not os.fstat(f.fileno()).st_size:
+            return b""
+        # plain segments are mapped rather than copied into a bytes object;
+        # the map stays alive as long as an array still views it
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def compress_segment(path):
+    tmp = path + ".zst.tmp"
+    with open(path, "rb") as src, open(tmp, "wb") as dst:
+        zstandard.ZstdCompressor().copy_stream(src, dst)
+    os.replace(tmp, path + ".zst")
+    os.remove(path)
+
+def parse_ts(ts):
+    # logs written before ts became epoch seconds hold ISO-8601 strings
+    return datetime.fromisoformat(ts).timestamp() if isinstance(ts, str) else ts
+
+def pack_record(snapshot, ts):
+    vals = [ts]
+    for ex in EXCHANGES:
+        v = snapshot.get(ex)
+        vals += (v[f] for f in FIELDS) if v else (np.nan,) * len(FIELDS)
+    return REC.pack(*vals)
+
+def decode_segment(path, data):
+    if ".bin" in path:
+        # drop a trailing partial record left by a crash mid-write
+        data = memoryview(data)[:len(data) - len(data) % REC.size]
+        return np.frombuffer(data, dtype=np.float64).reshape(-1, REC_WIDTH)
+
+    rows = [orjson.loads(l) for l in bytes(data).splitlines() if l.strip()]
+    records = np.full((len(rows), REC_WIDTH), np.nan)
+    for i, row in enumerate(rows):
+        records[i, 0] = parse_ts(row["ts"])
+        for j, ex in enumerate(EXCHANGES):
+            v = row["data"].get(ex)
+            if v:
+                records[i, 1 + 3 * j:4 + 3 * j] = [v[f] for f in FIELDS]
+    return records
+
+def append_point(state, ts, row):
+    series = state["series"]
+    price = float(SERIES_DTYPE(row[PRICE_AVG]))
+    # keep a running sum of the last WINDOW_LONG prices so VWAP is O(1)
+    if len(series) >= WINDOW_LONG:
+        state["price_sum_window"] += price - float(series.tail(WINDOW_LONG)[PRICE_AVG, 0])
+    else:
+        state["price_sum_window"] += price
+    series.append(row)
+    if series.head % WINDOW_LONG == 0:
+        # re-sum once per window so float drift can't accumulate
+        state["price_sum_window"] = float(series.tail(WINDOW_LONG)[PRICE_AVG].sum(dtype=np.float64))
 
-def now_ts():
-    return int(time.time())
+    state["ts"].append(ts)
+    state["seq"] += 1
 
 def load_history(symbol):
     state = {
-        "price_avg": deque(maxlen=MAX_POINTS),
-        "funding_avg": deque(maxlen=MAX_POINTS),
-        "oi_avg": deque(maxlen=MAX_POINTS),
-
-        "price_ex": {ex: deque(maxlen=MAX_POINTS) for ex in EXCHANGE_FUNCS},
-        "funding_ex": {ex: deque(maxlen=MAX_POINTS) for ex in EXCHANGE_FUNCS},
-        "oi_ex": {ex: deque(maxlen=MAX_POINTS) for ex in EXCHANGE_FUNCS},
+        "series": Ring(MAX_POINTS, len(COLUMNS), SERIES_DTYPE),
 
         "signals": deque(maxlen=1000),
         "last_signal_ts": 0,
-        "ts": deque(maxlen=MAX_POINTS),
+        "ts": Ring(MAX_POINTS),
+        "price_sum_window": 0.0,
+        "seq": 0,
     }
 
-    path = log_file(symbol)
-    if not os.path.exists(path):
-        return state
+    parts = []
+    for path in log_segments(symbol):
+        if not os.path.exists(path):
+            continue
+        try:
+            parts.append(decode_segment(path, read_segment(path)))
+        except:
+            continue
 
-    try:
-        with open(path) as f:
-            rows = [json.loads(l) for l in f if l.strip()]
-    except:
+    if not parts:
+        return state
+    records = np.concatenate(parts)
+    if not len(records):
         return state
 
-    for row in rows:
-        snap = row["data"]
-        ts = row["ts"]
-        prices, fundings, ois = [], [], []
+    # record values are the per-exchange columns as is; the averages come
+    # from a (rows, exchange, field) view over them
+    n = len(records)
+    ts = np.ascontiguousarray(records[:, 0])
+    cols = np.empty((len(COLUMNS), n), dtype=SERIES_DTYPE)
+    cols[len(FIELDS):] = records[:, 1:].T
+    cols[:len(FIELDS)] = np.nanmean(
+        records[:, 1:].reshape(n, len(EXCHANGES), len(FIELDS)), axis=1).T
+
+    state["series"].extend(cols)
+    state["ts"].extend(ts)
+    state["price_sum_window"] = float(cols[PRICE_AVG, -WINDOW_LONG:].sum(dtype=np.float64))
+    state["seq"] = n
+
+    # one compiled pass finds every historical signal instead of running the
+    # live checks after each replayed row; it sees the stored float32 values
+    # widened to float64, exactly as the live checks do
+    prices, fundings, ois = cols[:len(FIELDS)].astype(np.float64)
+    hits, levels, oi_changes, vwaps = _replay_signals(
+        ts, prices, fundings, ois, SIGNAL_THRESHOLDS,
+        SIGNAL_COOLDOWN, WINDOW_LONG, WINDOW_SHORT,
+    )
+    keep = slice(-state["signals"].maxlen, None)
+    for i, level, oi_change, vwap in zip(hits[keep].tolist(), levels[keep].tolist(),
+                                         oi_changes[keep].tolist(), vwaps[keep].tolist()):
+        state["signals"].append({
+            "ts": float(ts[i]),
+            "level": SIGNAL_LEVELS[level],
+            "price": float(prices[i]),
+            "funding": float(fundings[i]),
+            "oi_change": oi_change,
+            "vwap": vwap,
+        })
+    if len(hits):
+        state["last_signal_ts"] = float(ts[hits[-1]])
 
-        for ex, v in snap.items():
-            prices.append(v["price"])
-            fundings.append(v["funding"])
-            ois.append(v["oi"])
+    return state
 
-            state["price_ex"][ex].append(v["price"])
-            state["funding_ex"][ex].append(v["funding"])
-            state["oi_ex"][ex].append(v["oi"])
+def open_log(symbol):
+    path = log_file(symbol)
+    if os.path.exists(path) and os.path.getsize(path):
+        LOG_DAYS[symbol] = utc_day(os.path.getmtime(path))
+    else:
+        LOG_DAYS[symbol] = utc_day()
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    # cut a partial record left by a crash so new records stay aligned
+    size = os.fstat(fd).st_size
+    if size % REC.size:
+        os.ftruncate(fd, size - size % REC.size)
+    LOG_FDS[symbol] = fd
+
+def rotate_log(symbol):
+    fd = LOG_FDS.pop(symbol)
+    try:
+        sync_log(fd)
+    except OSError as e:
+        print(f"⚠️ {symbol} log sync failed before rotation:", e)
+    finally:
+        os.close(fd)
+    # whatever fails below, the symbol gets a live log back
+    try:
+        segment = os.path.join(DATA_DIR, f"{symbol}-{LOG_DAYS[symbol]}.bin")
+        os.replace(log_file(symbol), segment)
+        threading.Thread(target=compress_segment, args=(segment,), daemon=True).start()
+    finally:
+        open_log(symbol)
+    prune_segments(symbol)
+
+def retire_legacy_log(symbol):
+    # an open .jsonl log from before the binary format becomes that day's segment
+    path = legacy_log_file(symbol)
+    if os.path.exists(path):
+        os.replace(path, os.path.join(DATA_DIR, f"{symbol}-{utc_day(os.path.getmtime(path))}.jsonl"))
+
+def persist(symbol, snapshot, ts):
+    try:
+        WRITE_Q.put_nowait((symbol, pack_record(snapshot, ts)))
+    except queue.Full:
+        print(f"⚠️ {symbol} write queue full, record dropped")
+
+# appends only need the data and file size on disk, not the mtime; fdatasync
+# skips that extra metadata write where the platform has it
+sync_log = getattr(os, "fdatasync", os.fsync)
+
+def write_all(fd, data):
+    # one write() per batch; loop only in case the kernel takes a short write
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def append_log(symbol, data):
+    fd = LOG_FDS[symbol]
+    size = os.fstat(fd).st_size
+    try:
+        write_all(fd, data)
+    except OSError:
+        # cut a partly written batch back off: a torn record mid-file would
+        # misalign every fixed-width record after it
+        os.ftruncate(fd, size)
+        raise
+
+def _writer_loop():
+    # batches land in the page cache right away; logs written since the last
+    # sync are synced every WRITE_FSYNC_SEC so a power loss costs at most that
+    dirty = set()
+    last_sync = time.monotonic()
+    while True:
+        item = WRITE_Q.get()
+        batch = {}
+        count = 0
+        deadline = time.monotonic() + WRITE_FLUSH_SEC
+        while item is not None:
+            symbol, record = item
+            batch.setdefault(symbol, []).append(record)
+            count += 1
+            timeout = deadline - time.monotonic()
+            if count >= WRITE_BATCH_SIZE or timeout <= 0:
+                break
+            try:
+                item = WRITE_Q.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+        # a failing disk costs the affected batch, never the writer thread
+        today = utc_day()
+        for symbol, records in batch.items():
+            try:
+                if symbol not in LOG_FDS:
+                    open_log(symbol)
+                elif LOG_DAYS[symbol] != today:
+                    rotate_log(symbol)
+            except Exception as e:
+                print(f"⚠️ {symbol} log rotation failed:", e)
+            try:
+                append_log(symbol, b"".join(records))
+                dirty.add(symbol)
+            except Exception as e:
+                print(f"⚠️ {symbol} log write failed, {len(records)} records dropped:", e)
+
+        if time.monotonic() - last_sync >= WRITE_FSYNC_SEC:
+            for symbol in dirty:
+                try:
+                    sync_log(LOG_FDS[symbol])
+                except Exception as e:
+                    print(f"⚠️ {symbol} log sync failed:", e)
+            dirty.clear()
+            last_sync = time.monotonic()
 
-        state["price_avg"].append(mean(prices))
-        state["funding_avg"].append(mean(fundings))
-        state["oi_avg"].append(mean(ois))
-        state["ts"].append(ts)
+        if item is None:
+            break
 
-        sig = compute_realtime_signal(state)
-        if sig:
-            state["signals"].append(sig)
+    for symbol, fd in LOG_FDS.items():
+        try:
+            sync_log(fd)
+            os.close(fd)
+        except OSError as e:
+            print(f"⚠️ {symbol} log close failed:", e)
 
-    return state
+writer_thread = threading.Thread(target=_writer_loop, daemon=True)
 
-def persist(symbol, snapshot, ts):
-    record = {
-        "ts": ts,
-        "symbol": symbol,
-        "data": snapshot,
-    }
-    with open(log_file(symbol), "a") as f:
-        f.write(json.dumps(record) + "\n")
+@atexit.register
+def stop_writer():
+    if writer_thread.is_alive():
+        try:
+            WRITE_Q.put(None, timeout=5)
+        except queue.Full:
+            return
+        writer_thread.join(timeout=5)
 
 # ================= Exchange APIs =================
 
+SESSION = requests.Session()
+ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=64,
+    max_retries=Retry(total=HTTP_RETRIES, backoff_factor=0.2),
+)
+SESSION.mount("http://", ADAPTER)
+SESSION.mount("https://", ADAPTER)
+
+HTTP_CACHE = {}
+http_cache_lock = threading.Lock()
+
+def cache_ttl(url):
+    for key, ttl in CACHE_TTL.items():
+        if key in url:
+            return ttl
+    return 0
+
 def get_json(url):
-    r = requests.get(url, timeout=8)
+    ttl = cache_ttl(url)
+    if ttl:
+        with http_cache_lock:
+            hit = HTTP_CACHE.get(url)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+
+    r = SESSION.get(url, timeout=HTTP_TIMEOUT)
     r.raise_for_status()
-    return r.json()
+    data = r.json()
+    if ttl:
+        with http_cache_lock:
+            HTTP_CACHE[url] = (time.monotonic(), data)
+    return data
+
+# request URLs are fixed per symbol, so build them once
+BINANCE_URLS = {s: [
+    f"https://fapi.binance.com/fapi/v1/premiumIndex?symbol={s}",
+    f"https://fapi.binance.com/fapi/v1/openInterest?symbol={s}",
+] for s in SYMBOLS}
+BYBIT_URLS = {s: f"https://api.bybit.com/v5/market/tickers?category=linear&symbol={s}" for s in SYMBOLS}
+OKX_INST = {s: s.replace("USDT", "-USDT-SWAP") for s in SYMBOLS}
+OKX_URLS = {s: [
+    f"https://www.okx.com/api/v5/public/funding-rate?instId={inst}",
+    f"https://www.okx.com/api/v5/public/open-interest?instId={inst}",
+    f"https://www.okx.com/api/v5/market/ticker?instId={inst}",
+] for s, inst in OKX_INST.items()}
+BITGET_URLS = {s: f"https://api.bitget.com/api/v2/mix/market/ticker?symbol={s}&productType=USDT-FUTURES" for s in SYMBOLS}
+
+BYBIT_FIELDS = itemgetter("fundingRate", "markPrice", "openInterest")
+BITGET_FIELDS = itemgetter("fundingRate", "markPrice", "holdingAmount")
 
 def binance_data(symbol):
-    p = get_json(f"https://fapi.binance.com/fapi/v1/premiumIndex?symbol={symbol}")
-    oi = get_json(f"https://fapi.binance.com/fapi/v1/openInterest?symbol={symbol}")
+    p, oi = REQUEST_POOL.map(get_json, BINANCE_URLS[symbol])
     return {
         "funding": float(p["lastFundingRate"]),
         "price": float(p["markPrice"]),
@@ -121,19 +544,12 @@ def binance_data(symbol):
     }
 
 def bybit_data(symbol):
-    r = get_json(f"https://api.bybit.com/v5/market/tickers?category=linear&symbol={symbol}")
-    item = r["result"]["list"][0]
-    return {
-        "funding": float(item["fundingRate"]),
-        "price": float(item["markPrice"]),
-        "oi": float(item["openInterest"]),
-    }
+    r = get_json(BYBIT_URLS[symbol])
+    funding, price, oi = map(float, BYBIT_FIELDS(r["result"]["list"][0]))
+    return {"funding": funding, "price": price, "oi": oi}
 
 def okx_data(symbol):
-    inst = symbol.replace("USDT", "-USDT-SWAP")
-    f = get_json(f"https://www.okx.com/api/v5/public/funding-rate?instId={inst}")
-    oi = get_json(f"https://www.okx.com/api/v5/public/open-interest?instId={inst}")
-    p = get_json(f"https://www.okx.com/api/v5/market/ticker?instId={inst}")
+    f, oi, p = REQUEST_POOL.map(get_json, OKX_URLS[symbol])
     return {
         "funding": float(f["data"][0]["fundingRate"]),
         "oi": float(oi["data"][0]["oi"]),
@@ -141,13 +557,9 @@ def okx_data(symbol):
     }
 
 def bitget_data(symbol):
-    r = get_json(f"https://api.bitget.com/api/v2/mix/market/ticker?symbol={symbol}&productType=USDT-FUTURES")
-    item = r["data"][0]
-    return {
-        "funding": float(item["fundingRate"]),
-        "price": float(item["markPrice"]),
-        "oi": float(item["holdingAmount"]),
-    }
+    r = get_json(BITGET_URLS[symbol])
+    funding, price, oi = map(float, BITGET_FIELDS(r["data"][0]))
+    return {"funding": funding, "price": price, "oi": oi}
 
 EXCHANGE_FUNCS = {
     "binance": binance_data,
@@ -155,162 +567,299 @@ EXCHANGE_FUNCS = {
     "okx": okx_data,
     "bitget": bitget_data,
 }
+FETCH_JOBS = tuple((symbol, name, fn) for symbol in SYMBOLS for name, fn in EXCHANGE_FUNCS.items())
+
+# exchange calls and the raw GETs they fan out to use separate pools so a
+# nested wait can never starve the pool it is waiting on
+FETCH_POOL = ThreadPoolExecutor(max_workers=len(SYMBOLS) * len(EXCHANGE_FUNCS))
+REQUEST_POOL = ThreadPoolExecutor(max_workers=len(SYMBOLS) * len(EXCHANGE_FUNCS) * 2)
 
 # ================= Signal Engine =================
 
-def compute_signal_on_series(state):
-    prices = list(state["price_avg"])
-    fundings = list(state["funding_avg"])
-    ois = list(state["oi_avg"])
+SIGNAL_LEVELS = (
+    None,
+    "STRONG_SHORT",
+    "PREPARE_SHORT",
+    "STRONG_LONG",
+    "PREPARE_LONG",
+    "PULLBACK_SHORT",
+    "PULLBACK_LONG",
+)
+
+# plain ints so the compiled pullback kernel sees them as constants
+PULLBACK_SHORT = SIGNAL_LEVELS.index("PULLBACK_SHORT")
+PULLBACK_LONG = SIGNAL_LEVELS.index("PULLBACK_LONG")
+
+SIGNAL_THRESHOLDS = np.array([
+    SIGNAL_CONFIG["funding_strong"],
+    SIGNAL_CONFIG["funding_warn"],
+    SIGNAL_CONFIG["oi_drop_pct"],
+    SIGNAL_CONFIG["price_break_pct"],
+], dtype=np.float64)
+SIGNAL_COOLDOWN = float(SIGNAL_CONFIG["cooldown_sec"])
+
+def _cascade_level(funding_strong, funding_warn, oi_break, price_break,
+                   funding_long_strong, funding_long_warn, oi_rise, price_rise):
+    if funding_strong and oi_break and price_break:
+        return SIGNAL_LEVELS.index("STRONG_SHORT")
+    if funding_warn and oi_break:
+        return SIGNAL_LEVELS.index("PREPARE_SHORT")
+    if funding_long_strong and oi_rise and price_rise:
+        return SIGNAL_LEVELS.index("STRONG_LONG")
+    if funding_long_warn and oi_rise:
+        return SIGNAL_LEVELS.index("PREPARE_LONG")
+    return 0
+
+# the cascade above evaluated once for every combination of its eight
+# conditions (bit k = argument k), so the kernel picks a level with one lookup
+LEVEL_TABLE = np.array(
+    [_cascade_level(*((mask >> k) & 1 for k in range(8))) for mask in range(256)],
+    dtype=np.int64,
+)
+
+@njit(cache=True, fastmath=True)
+def _signal_core(price_now, funding_now, oi_now, oi_prev, vwap, thresholds):
+    funding_strong_th = thresholds[0]
+    funding_warn_th = thresholds[1]
+    oi_drop_pct = thresholds[2]
+    price_break_pct = thresholds[3]
+
+    funding_strong = funding_now <= funding_strong_th
+    funding_warn = funding_now <= funding_warn_th
+    funding_long_strong = funding_now >= -funding_strong_th
+    funding_long_warn = funding_now >= -funding_warn_th
+
+    oi_change = (oi_now - oi_prev) / oi_prev if oi_prev else 0.0
+
+    oi_break = oi_change <= oi_drop_pct
+    oi_rise = oi_change >= -oi_drop_pct
+
+    price_break = (price_now - vwap) / vwap <= price_break_pct
+    price_rise = (price_now - vwap) / vwap >= -price_break_pct
+
+    mask = (
+        int(funding_strong)
+        | int(funding_warn) << 1
+        | int(oi_break) << 2
+        | int(price_break) << 3
+        | int(funding_long_strong) << 4
+        | int(funding_long_warn) << 5
+        | int(oi_rise) << 6
+        | int(price_rise) << 7
+    )
+    level = LEVEL_TABLE[mask]
+
+    return level, price_now, funding_now, oi_change, vwap
 
-    window = int(1800 / REFRESH_INTERVAL)
-    if len(prices) < window or len(ois) < window:
+def compute_signal_on_series(state):
+    series = state["series"]
+    if len(series) < WINDOW_LONG:
         return None
 
-    funding_now = fundings[-1]
-    price_now = prices[-1]
-    oi_now = ois[-1]
-
-    funding_strong = funding_now <= SIGNAL_CONFIG["funding_strong"]
-    funding_warn = funding_now <= SIGNAL_CONFIG["funding_warn"]
-    funding_long_strong = funding_now >= -SIGNAL_CONFIG["funding_strong"]
-    funding_long_warn = funding_now >= -SIGNAL_CONFIG["funding_warn"]
-
-    oi_prev = ois[-window]
-    oi_change = (oi_now - oi_prev) / oi_prev if oi_prev else 0
-
-    oi_break = oi_change <= SIGNAL_CONFIG["oi_drop_pct"]
-    oi_rise = oi_change >= -SIGNAL_CONFIG["oi_drop_pct"]
-
-    vwap = mean(prices[-window:])
-    price_break = (price_now - vwap) / vwap <= SIGNAL_CONFIG["price_break_pct"]
-    price_rise = (price_now - vwap) / vwap >= -SIGNAL_CONFIG["price_break_pct"]
-
-    now = now_ts()
-    if now - state["last_signal_ts"] < SIGNAL_CONFIG["cooldown_sec"]:
+    now = state["ts"][-1]
+    if now - state["last_signal_ts"] < SIGNAL_COOLDOWN:
         return None
 
-    if funding_strong and oi_break and price_break:
-        level = "STRONG_SHORT"
-    elif funding_warn and oi_break:
-        level = "PREPARE_SHORT"
-    elif funding_long_strong and oi_rise and price_rise:
-        level = "STRONG_LONG"
-    elif funding_long_warn and oi_rise:
-        level = "PREPARE_LONG"
-    else:
+    cols = series.tail(WINDOW_LONG)[:len(FIELDS)].astype(np.float64)
+    level, price_now, funding_now, oi_change, vwap = _signal_core(
+        cols[PRICE_AVG, -1], cols[FUNDING_AVG, -1], cols[OI_AVG, -1], cols[OI_AVG, 0],
+        state["price_sum_window"] / WINDOW_LONG, SIGNAL_THRESHOLDS,
+    )
+    if not level:
         return None
 
     state["last_signal_ts"] = now
-    idx = len(prices) - 1
     return {
-        "ts": state["ts"][idx],
-        "level": level,
+        "ts": now,
+        "level": SIGNAL_LEVELS[level],
         "price": price_now,
         "funding": funding_now,
         "oi_change": oi_change,
         "vwap": vwap,
     }
 
-def compute_pullback_on_series(state):
-    prices = list(state["price_avg"])
-    fundings = list(state["funding_avg"])
-    ois = list(state["oi_avg"])
+@njit(cache=True, fastmath=True)
+def _pullback_core(price_now, funding_now, oi_now, price_prev, funding_prev, oi_prev, vwap):
+    trend_down = price_now < vwap
+    trend_up = price_now > vwap
 
-    long_window = int(1800 / REFRESH_INTERVAL)
-    short_window = int(600 / REFRESH_INTERVAL)
-    if len(prices) < long_window or len(prices) < short_window or len(ois) < short_window:
-        return None
+    rebound = (price_now - price_prev) / price_prev >= 0.008
+    near_vwap = abs(price_now - vwap) / vwap <= 0.003
 
-    price_now = prices[-1]
-    funding_now = fundings[-1]
-    oi_now = ois[-1]
+    funding_rebound = funding_prev < funding_now < 0
+    oi_change = (oi_now - oi_prev) / oi_prev
+    oi_hold = oi_change >= -0.01
 
-    vwap_30 = mean(prices[-long_window:])
-    trend_down = price_now < vwap_30
-    trend_up = price_now > vwap_30
+    setup = rebound & near_vwap & funding_rebound & oi_hold
+    if setup and trend_down:
+        level = PULLBACK_SHORT
+    elif setup and trend_up:
+        level = PULLBACK_LONG
+    else:
+        level = 0
 
-    rebound = (prices[-1] - prices[-short_window]) / prices[-short_window] >= 0.008
-    near_vwap = abs(price_now - vwap_30) / vwap_30 <= 0.003
+    return level, price_now, funding_now, oi_change, vwap
 
-    funding_rebound = fundings[-short_window] < funding_now < 0
-    oi_change = (oi_now - ois[-short_window]) / ois[-short_window]
-    oi_hold = oi_change >= -0.01
+def compute_pullback_on_series(state):
+    series = state["series"]
+    if len(series) < WINDOW_LONG or len(series) < WINDOW_SHORT:
+        return None
 
-    now = now_ts()
-    if now - state["last_signal_ts"] < SIGNAL_CONFIG["cooldown_sec"]:
+    now = state["ts"][-1]
+    if now - state["last_signal_ts"] < SIGNAL_COOLDOWN:
         return None
 
-    if trend_down and rebound and near_vwap and funding_rebound and oi_hold:
-        state["last_signal_ts"] = now
-        idx = len(prices) - 1
-        return {
-            "ts": state["ts"][idx],
-            "level": "PULLBACK_SHORT",
-            "price": price_now,
-            "funding": funding_now,
-            "oi_change": oi_change,
-            "vwap": vwap_30,
-        }
-
-    if trend_up and rebound and near_vwap and funding_rebound and oi_hold:
-        state["last_signal_ts"] = now
-        idx = len(prices) - 1
-        return {
-            "ts": state["ts"][idx],
-            "level": "PULLBACK_LONG",
-            "price": price_now,
-            "funding": funding_now,
-            "oi_change": oi_change,
-            "vwap": vwap_30,
-        }
+    cols = series.tail(WINDOW_SHORT)[:len(FIELDS)].astype(np.float64)
+    level, price_now, funding_now, oi_change, vwap_30 = _pullback_core(
+        cols[PRICE_AVG, -1], cols[FUNDING_AVG, -1], cols[OI_AVG, -1],
+        cols[PRICE_AVG, 0], cols[FUNDING_AVG, 0], cols[OI_AVG, 0],
+        state["price_sum_window"] / WINDOW_LONG,
+    )
+    if not level:
+        return None
+
+    state["last_signal_ts"] = now
+    return {
+        "ts": now,
+        "level": SIGNAL_LEVELS[level],
+        "price": price_now,
+        "funding": funding_now,
+        "oi_change": oi_change,
+        "vwap": vwap_30,
+    }
 
 def compute_realtime_signal(state):
     return compute_pullback_on_series(state) or compute_signal_on_series(state)
 
+@njit(cache=True, fastmath=True)
+def _replay_signals(ts, prices, fundings, ois, thresholds, cooldown, window_long, window_short):
+    # compute_realtime_signal after every row, in one pass: same gates, same
+    # pullback-before-signal order, with the VWAP sum kept alongside
+    n = len(ts)
+    hits = np.empty(n, dtype=np.int64)
+    levels = np.empty(n, dtype=np.int64)
+    oi_changes = np.empty(n, dtype=np.float64)
+    vwaps = np.empty(n, dtype=np.float64)
+    found = 0
+    last_ts = 0.0
+
+    i = max(window_long, window_short) - 1
+    price_sum = prices[i + 1 - window_long:i + 1].sum() if i < n else 0.0
+    while i < n:
+        if ts[i] - last_ts >= cooldown:
+            vwap = price_sum / window_long
+            j = i + 1 - window_short
+            level, _, _, oi_change, _ = _pullback_core(
+                prices[i], fundings[i], ois[i], prices[j], fundings[j], ois[j], vwap)
+            if not level:
+                level, _, _, oi_change, _ = _signal_core(
+                    prices[i], fundings[i], ois[i], ois[i + 1 - window_long], vwap, thresholds)
+            if level:
+                hits[found] = i
+                levels[found] = level
+                oi_changes[found] = oi_change
+                vwaps[found] = vwap
+                found += 1
+                last_ts = ts[i]
+
+                # nothing inside the cooldown can fire, so jump past it and
+                # re-sum the window where the scan resumes
+                skip = i + 1 + np.searchsorted(ts[i + 1:], last_ts + cooldown)
+                if skip > i + 1:
+                    i = skip
+                    if i < n:
+                        price_sum = prices[i + 1 - window_long:i + 1].sum()
+                    continue
+
+        i += 1
+        if i < n:
+            price_sum += prices[i] - prices[i - window_long]
+            if (i + 1) % window_long == 0:
+                price_sum = prices[i + 1 - window_long:i + 1].sum()
+
+    return hits[:found], levels[:found], oi_changes[:found], vwaps[:found]
+
+def warm_signal_core():
+    _signal_core(1.0, 1.0, 1.0, 1.0, 1.0, SIGNAL_THRESHOLDS)
+    _pullback_core(1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0)
+    one = np.ones(1)
+    _replay_signals(one, one, one, one, SIGNAL_THRESHOLDS,
+                    SIGNAL_COOLDOWN, WINDOW_LONG, WINDOW_SHORT)
+
 # ================= Collector =================
 
-def collector(symbol):
-    print(f"▶️ collector started for {symbol}")
+def ingest(symbol, snapshot, snapshot_ts):
     state = symbols_state[symbol]
-
+    row = np.full(len(COLUMNS), np.nan)
+    price_sum = funding_sum = oi_sum = 0.0
+    ex_block = EX_BLOCK
+    for ex, v in snapshot.items():
+        price, funding, oi = v["price"], v["funding"], v["oi"]
+        price_sum += price
+        funding_sum += funding
+        oi_sum += oi
+        row[ex_block[ex]] = price, funding, oi
+
+    # collector only ingests snapshots with at least one exchange
+    n = len(snapshot)
+    row[:len(FIELDS)] = price_sum / n, funding_sum / n, oi_sum / n
+    append_point(state, snapshot_ts, row)
+
+    persist(symbol, snapshot, snapshot_ts)
+
+    sig = compute_realtime_signal(state)
+    if sig:
+        state["signals"].append(sig)
+        print("🚨 SIGNAL:", symbol, sig)
+
+    refresh_cached(symbol)
+
+def collector():
+    print("▶️ collector started for", ", ".join(SYMBOLS))
+
+    inflight = {}
+    next_tick = time.monotonic()
     while True:
+        # one bad tick must not end the only collector thread
         try:
-            snapshot_ts = datetime.now(timezone(timedelta(hours=8))).isoformat()
-            snapshot = {}
-            for name, fn in EXCHANGE_FUNCS.items():
+            snapshot_ts = time.time()
+            # a fetch still running from an earlier tick keeps its slot; queueing
+            # another behind it would starve the pool for the healthy exchanges
+            futures = {}
+            for symbol, name, fn in FETCH_JOBS:
+                prev = inflight.get((symbol, name))
+                if prev is not None and not prev.done():
+                    continue
+                fut = FETCH_POOL.submit(fn, symbol)
+                inflight[(symbol, name)] = fut
+                futures[fut] = (symbol, name)
+
+            snapshots = {symbol: {} for symbol in SYMBOLS}
+            try:
+                for fut in as_completed(futures, timeout=FETCH_BUDGET):
+                    symbol, name = futures[fut]
+                    try:
+                        snapshots[symbol][name] = fut.result()
+                    except Exception as e:
+                        print(f"⚠️ {symbol} {name} failed:", e)
+            except FetchTimeout:
+                for fut in futures:
+                    fut.cancel()
+                print(f"⚠️ some exchange fetches still running after {FETCH_BUDGET}s, left out of this tick")
+
+            for symbol, snapshot in snapshots.items():
+                if not snapshot:
+                    continue
                 try:
-                    snapshot[name] = fn(symbol)
+                    ingest(symbol, snapshot, snapshot_ts)
                 except Exception as e:
-                    print(f"⚠️ {symbol} {name} failed:", e)
-
-            if snapshot:
-                prices, fundings, ois = [], [], []
-                for ex, v in snapshot.items():
-                    prices.append(v["price"])
-                    fundings.append(v["funding"])
-                    ois.append(v["oi"])
-
-                    state["price_ex"][ex].append(v["price"])
-                    state["funding_ex"][ex].append(v["funding"])
-                    state["oi_ex"][ex].append(v["oi"])
-
-                state["price_avg"].append(mean(prices))
-                state["funding_avg"].append(mean(fundings))
-                state["oi_avg"].append(mean(ois))
-                state["ts"].append(snapshot_ts)
-
-                persist(symbol, snapshot, snapshot_ts)
-
-                sig = compute_realtime_signal(state)
-                if sig:
-                    state["signals"].append(sig)
-                    print("🚨 SIGNAL:", symbol, sig)
-
+                    print(f"collector {symbol} error:", e)
         except Exception as e:
-            print(f"collector {symbol} error:", e)
+            print("collector tick error:", e)
 
-        time.sleep(REFRESH_INTERVAL)
+        # sleep to the next tick boundary so fetch time doesn't stretch the interval
+        next_tick = max(next_tick + REFRESH_INTERVAL, time.monotonic())
+        time.sleep(max(0, next_tick - time.monotonic()))
 
 # ================= Web =================
 
@@ -390,6 +939,9 @@ const COLORS = {
   bitget: "#22c55e",
 };
 
+// ts values are epoch seconds; show them as HH:MM:SS in UTC+8
+const fmtTime = t => new Date((t + 8 * 3600) * 1000).toISOString().slice(11, 19);
+
 function makeMultiChart(id, formatter=null) {
   return new Chart(document.getElementById(id), {
     type: "line",
@@ -478,7 +1030,7 @@ function buildDatasets(chart, ts, avg, exMap, unitLabel, markers=[]) {
     });
   }
 
-  chart.data.labels = ts.map(t => t.slice(11,19));
+  chart.data.labels = ts.map(fmtTime);
   chart.data.datasets = datasets;
   chart.update();
 }
@@ -489,7 +1041,7 @@ async function refresh() {
   const signals = data.signals || [];
 
   const markers = signals.map(s => ({
-    x: s.ts.slice(11,19),
+    x: fmtTime(s.ts),
     y: s.price,
     level: s.level
   }));
@@ -510,7 +1062,7 @@ async function refresh() {
     if (s.level === "PULLBACK_LONG") cls = "signal-pullback-long";
     tbody.innerHTML += `
       <tr class="${cls}">
-        <td>${s.ts.slice(11,19)}</td>
+        <td>${fmtTime(s.ts)}</td>
         <td>${s.level}</td>
         <td>${(s.funding*100).toFixed(4)}%</td>
         <td>${(s.oi_change*100).toFixed(2)}%</td>
@@ -528,44 +1080,122 @@ refresh();
 </html>
 """
 
+RENDERED_HOME = app.jinja_env.from_string(HTML).render(symbols=SYMBOLS).encode()
+HOME_ETAG = hashlib.sha1(RENDERED_HOME).hexdigest()
+
 @app.route("/")
 def home():
-    return render_template_string(HTML, symbols=SYMBOLS)
+    resp = Response(RENDERED_HOME, mimetype="text/html")
+    resp.set_etag(HOME_ETAG)
+    return resp.make_conditional(request)
 
-@app.route("/api/state")
-def api_state():
-    symbol = request.args.get("symbol", SYMBOLS[0])
-    range_sec = int(request.args.get("range", 86400))
-    state = symbols_state.get(symbol)
-    if not state:
-        return jsonify({})
-    points = int(range_sec / REFRESH_INTERVAL)
-    ts = slice_deque(state["ts"], points)
-
-    cutoff_ts = ts[0] if ts else None
+ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _orjson_response(obj):
+    return Response(orjson.dumps(obj, option=ORJSON_OPTS), mimetype="application/json")
+
+def range_points(range_sec):
+    return min(max(int(range_sec / REFRESH_INTERVAL), 1), MAX_POINTS)
+
+def serialize_state(symbol, points):
+    state = symbols_state[symbol]
+    ts = state["ts"].tail(points)
+    cols = state["series"].tail(points)
+
+    # signals are in time order, so walk back from the newest and stop at the cutoff
+    cutoff_ts = ts[0] if len(ts) else None
     signals = []
-    for s in state["signals"]:
-        if not cutoff_ts or s["ts"] >= cutoff_ts:
-            signals.append(s)
+    for s in reversed(state["signals"]):
+        if cutoff_ts is not None and s["ts"] < cutoff_ts:
+            break
+        signals.append(s)
+    signals.reverse()
 
-    return jsonify({
+    return orjson.dumps({
         "ts": ts,
-        "price_avg": slice_deque(state["price_avg"], points),
-        "funding_avg": slice_deque(state["funding_avg"], points),
-        "oi_avg": slice_deque(state["oi_avg"], points),
-        "price_ex": {k: slice_deque(v, points) for k, v in state["price_ex"].items()},
-        "funding_ex": {k: slice_deque(v, points) for k, v in state["funding_ex"].items()},
-        "oi_ex": {k: slice_deque(v, points) for k, v in state["oi_ex"].items()},
+        "price_avg": cols[PRICE_AVG],
+        "funding_avg": cols[FUNDING_AVG],
+        "oi_avg": cols[OI_AVG],
+        # exchange columns line up with ts; a missed fetch is NaN, sent as null
+        "price_ex": {ex: cols[c] for ex, c in EX_COLS["price"].items()},
+        "funding_ex": {ex: cols[c] for ex, c in EX_COLS["funding"].items()},
+        "oi_ex": {ex: cols[c] for ex, c in EX_COLS["oi"].items()},
         "signals": signals,
-    })
+    }, option=ORJSON_OPTS)
+
+def _rebuild(symbol, points):
+    # read seq first: a point appended mid-build leaves the entry marked stale
+    seq = symbols_state[symbol]["seq"]
+    payload = serialize_state(symbol, points)
+    entry = (seq, payload, hashlib.sha1(payload).hexdigest())
+    with cache_lock:
+        RESPONSE_CACHE[(symbol, points)] = entry
+        RESPONSE_CACHE.move_to_end((symbol, points))
+        while len(RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+            evicted, _ = RESPONSE_CACHE.popitem(last=False)
+            requested.discard(evicted)
+        rebuilding.discard((symbol, points))
+    return entry
+
+def refresh_cached(symbol):
+    # views nobody polled since the last tick are rebuilt lazily on request
+    with cache_lock:
+        keys = [k for k in requested if k[0] == symbol and k in RESPONSE_CACHE]
+        requested.difference_update(keys)
+    for key in keys:
+        _rebuild(*key)
+
+@app.route("/api/state")
+def api_state():
+    symbol = request.args.get("symbol", SYMBOLS[0])
+    points = range_points(request.args.get("range", 86400, type=int))
+    if symbol not in symbols_state:
+        return _orjson_response({})
+
+    key = (symbol, points)
+    seq = symbols_state[symbol]["seq"]
+    with cache_lock:
+        requested.add(key)
+        cached = RESPONSE_CACHE.get(key)
+        if cached is not None:
+            RESPONSE_CACHE.move_to_end(key)
+        revalidate = cached is not None and cached[0] != seq and key not in rebuilding
+        if revalidate:
+            rebuilding.add(key)
+
+    if cached is None:
+        cached = _rebuild(symbol, points)
+    elif revalidate:
+        threading.Thread(target=_rebuild, args=key, daemon=True).start()
+
+    _, payload, etag = cached
+    resp = Response(payload, mimetype="application/json")
+    resp.set_etag(etag)
+    # every poll revalidates; an unchanged view comes back as a 304
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
 
 # ================= Bootstrap =================
 
 def start_symbol(symbol):
+    retire_legacy_log(symbol)
+    prune_segments(symbol)
     symbols_state[symbol] = load_history(symbol)
-    threading.Thread(target=collector, args=(symbol,), daemon=True).start()
+    # finish compressing any day whose rotation was cut short by a restart
+    for ext in ("bin", "jsonl"):
+        for segment in glob.glob(os.path.join(DATA_DIR, f"{symbol}-*.{ext}")):
+            threading.Thread(target=compress_segment, args=(segment,), daemon=True).start()
+    open_log(symbol)
+
+def bootstrap():
+    writer_thread.start()
+    warm_signal_core()
+    # histories are independent; decompression and numpy work overlap across threads
+    with ThreadPoolExecutor(len(SYMBOLS)) as ex:
+        list(ex.map(start_symbol, SYMBOLS))
+    threading.Thread(target=collector, daemon=True).start()
 
 if __name__ == "__main__":
-    for sym in SYMBOLS:
-        start_symbol(sym)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    bootstrap()
     app.run(host="0.0.0.0", port=8081, debug=False)
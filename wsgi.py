@@ -0,0 +1,6 @@
+# WSGI entry point: importing it starts the collector in the serving process
+# gunicorn -c gunicorn.conf.py   (or any WSGI server pointed at wsgi:app)
+
+from main import app, bootstrap
+
+bootstrap()